@@ -8,36 +8,213 @@ and visualization of participant responses.
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy import stats
 import os
 import json
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from .result_files import RESULT_FILE_RE
 
 
-def load_results_from_csv(file_path):
+# Ethical frameworks in a fixed order, so category code 0 is always utilitarian
+FRAMEWORK_DTYPE = pd.CategoricalDtype(categories=['utilitarian', 'deontological'])
+
+# Dominant framework labels assigned per participant
+DOMINANT_FRAMEWORK_DTYPE = pd.CategoricalDtype(categories=['Utilitarian', 'Deontological', 'Mixed'])
+
+# Quantiles for the reaction time box plot: whisker low, q1, median, q3, whisker high
+BOXPLOT_QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
+
+# Minimum total size of the result files before they are parsed in a process pool
+PARALLEL_LOAD_MIN_BYTES = 64 * 1024 * 1024
+
+# Column dtypes of the result CSVs written by the experiment app
+RESULT_DTYPES = {
+    'Participant ID': 'string',
+    'Dilemma ID': 'string',  # legacy summary rows hold text here; _prepare_results makes it numeric
+    'Dilemma Title': 'string',
+    'Choice': 'string',
+    'Ethical Framework': FRAMEWORK_DTYPE,
+    'Reaction Time (s)': 'float64',
+    'Timestamp': 'string'
+}
+
+
+def _cast_result_dtypes(df):
+    """
+    Cast the result columns present in a DataFrame to RESULT_DTYPES.
+    
+    Parquet files keep whatever types they were written with (e.g. integer
+    IDs), so this aligns them with the CSV loaders before combining.
+    
+    Args:
+        df: DataFrame containing experiment results
+        
+    Returns:
+        DataFrame with the result column dtypes
+    """
+    return df.astype({column: dtype for column, dtype in RESULT_DTYPES.items() if column in df})
+
+
+def _prepare_results(df):
+    """
+    Convert the low-cardinality result columns to categorical dtypes
+    and add the derived columns shared by the analysis functions.
+    
+    Args:
+        df: DataFrame containing experiment results
+        
+    Returns:
+        DataFrame with categorical and derived columns
+    """
+    df['Ethical Framework'] = df['Ethical Framework'].astype(FRAMEWORK_DTYPE)
+    if 'Dilemma ID' in df:
+        # Numeric IDs keep the dilemmas in 1..10 order instead of sorting them as text
+        df['Dilemma ID'] = pd.to_numeric(df['Dilemma ID'], errors='coerce').astype('Int64')
+    # Unknown framework labels become NaN in the cast, and summary rows from older
+    # versions of the app carry no dilemma ID; drop both so every code is valid
+    df = df.dropna(subset=[column for column in ('Dilemma ID', 'Ethical Framework') if column in df])
+    df['is_utilitarian'] = df['Ethical Framework'].cat.codes.to_numpy() == 0
+    
+    # Other columns may have been left out when loading a subset
+    for column in ('Dilemma ID', 'Dilemma Title', 'Participant ID'):
+        if column in df:
+            df[column] = df[column].astype('category')
+    
+    # Pack the dilemma ID and title codes into one integer key for grouping
+    if 'Dilemma ID' in df and 'Dilemma Title' in df:
+        dilemma_codes = df['Dilemma ID'].cat.codes.to_numpy().astype(np.uint64)
+        title_codes = df['Dilemma Title'].cat.codes.to_numpy().astype(np.uint64)
+        df['Dilemma Key'] = (dilemma_codes << np.uint64(32)) | title_codes
+    return df
+
+
+def _arrow_csv_convert_options(columns=None):
+    """
+    Build pyarrow CSV conversion options with fixed result column types.
+    
+    Fixing the types keeps pyarrow from inferring them, e.g. parsing the
+    Timestamp column into datetimes.
+    
+    Args:
+        columns: Columns to read (optional, defaults to all columns in the file)
+        
+    Returns:
+        pyarrow.csv.ConvertOptions
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    
+    return pa_csv.ConvertOptions(
+        column_types={column: pa.float64() if column == 'Reaction Time (s)' else pa.string()
+                      for column in RESULT_DTYPES},
+        include_columns=list(columns) if columns is not None else None,
+        strings_can_be_null=True
+    )
+
+
+def load_results_from_csv(file_path, columns=None, prepare=True):
     """
     Load experiment results from a CSV file.
     
+    Uses pyarrow's multithreaded CSV reader when pyarrow is installed.
+    
     Args:
         file_path: Path to the CSV file
+        columns: Columns to load (optional, defaults to all result columns)
+        prepare: Add the categorical and derived columns (optional, pass False
+            when the frame is combined with others first)
         
     Returns:
         DataFrame containing the results
     """
     try:
-        df = pd.read_csv(file_path)
-        # Filter out summary rows if they exist
-        df = df[~df['Dilemma ID'].isna()]
-        return df
+        usecols = list(columns) if columns is not None else list(RESULT_DTYPES)
+        try:
+            import pyarrow.csv as pa_csv
+        except ImportError:
+            df = pd.read_csv(file_path, dtype=RESULT_DTYPES, usecols=usecols, engine='c')
+        else:
+            table = pa_csv.read_csv(file_path, convert_options=_arrow_csv_convert_options(usecols))
+            df = table.to_pandas(split_blocks=True, self_destruct=True)
+        # Filter out summary rows written by older versions of the app (they carry no ethical framework)
+        df = df.dropna(subset=['Ethical Framework'])
+        return _prepare_results(df) if prepare else df
+    except Exception as e:
+        print(f"Error loading results: {e}")
+        return None
+
+
+def load_results(file_path, columns=None, prepare=True):
+    """
+    Load experiment results from a Parquet or CSV file.
+    
+    Parquet files only read the requested columns from disk.
+    
+    Args:
+        file_path: Path to the result file
+        columns: Columns to load (optional, defaults to all result columns);
+            must include 'Ethical Framework'
+        prepare: Add the categorical and derived columns (optional, pass False
+            when the frame is combined with others first)
+        
+    Returns:
+        DataFrame containing the results
+    """
+    if not file_path.endswith('.parquet'):
+        return load_results_from_csv(file_path, columns, prepare)
+    
+    try:
+        df = pd.read_parquet(file_path, columns=list(columns) if columns is not None else None,
+                             engine='pyarrow')
+        df = _cast_result_dtypes(df).dropna(subset=['Ethical Framework'])
+        return _prepare_results(df) if prepare else df
+    except Exception as e:
+        print(f"Error loading results: {e}")
+        return None
+
+
+def load_results_dataset(paths, columns=None):
+    """
+    Load and combine result files in a single pass with pyarrow datasets.
+    
+    Args:
+        paths: Paths to CSV or Parquet result files
+        columns: Columns to load (optional, defaults to all result columns);
+            must include 'Ethical Framework'
+        
+    Returns:
+        DataFrame containing the combined results, or None if a file could not be read
+        
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    import pyarrow.dataset as ds
+    
+    columns = list(columns) if columns is not None else list(RESULT_DTYPES)
+    csv_format = ds.CsvFileFormat(convert_options=_arrow_csv_convert_options())
+    
+    try:
+        frames = []
+        for file_format, extension in ((csv_format, '.csv'), ('parquet', '.parquet')):
+            format_paths = [path for path in paths if path.endswith(extension)]
+            if format_paths:
+                table = ds.dataset(format_paths, format=file_format).to_table(columns=columns)
+                frames.append(_cast_result_dtypes(table.to_pandas(split_blocks=True, self_destruct=True)))
     except Exception as e:
         print(f"Error loading results: {e}")
         return None
+    
+    if not frames:
+        return pd.DataFrame()
+    df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    # Filter out summary rows written by older versions of the app
+    return _prepare_results(df.dropna(subset=['Ethical Framework']))
 
 
 def load_all_results(directory_path):
     """
-    Load all result CSV files from a directory.
+    Load all result files (CSV or Parquet) from a directory.
     
     Args:
         directory_path: Path to directory containing result files
@@ -45,17 +222,25 @@ def load_all_results(directory_path):
     Returns:
         DataFrame containing combined results
     """
-    all_dfs = []
-    
-    for filename in os.listdir(directory_path):
-        if filename.endswith('.csv') and 'trolley_results' in filename:
-            file_path = os.path.join(directory_path, filename)
-            df = load_results_from_csv(file_path)
-            if df is not None:
-                all_dfs.append(df)
+    with os.scandir(directory_path) as entries:
+        result_entries = [entry for entry in entries
+                          if RESULT_FILE_RE.fullmatch(entry.name) and entry.is_file()]
+    paths = [entry.path for entry in result_entries]
+    total_bytes = sum(entry.stat().st_size for entry in result_entries)
+    
+    # Files are parsed raw and prepared once after combining them
+    load_raw = functools.partial(load_results, prepare=False)
+    
+    # Worker start-up outweighs parsing small files, so only large directories use a process pool
+    if len(paths) > 1 and total_bytes >= PARALLEL_LOAD_MIN_BYTES and (os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor() as executor:
+            loaded = list(executor.map(load_raw, paths))
+    else:
+        loaded = [load_raw(path) for path in paths]
+    all_dfs = [df for df in loaded if df is not None]
     
     if all_dfs:
-        return pd.concat(all_dfs, ignore_index=True)
+        return _prepare_results(pd.concat(all_dfs, ignore_index=True))
     else:
         return pd.DataFrame()
 
@@ -70,12 +255,11 @@ def calculate_framework_percentages(df):
     Returns:
         Dictionary with framework percentages
     """
-    framework_counts = df['Ethical Framework'].value_counts()
-    total = framework_counts.sum()
+    utilitarian_percentage = df['is_utilitarian'].mean() * 100
     
     percentages = {
-        'utilitarian': (framework_counts.get('utilitarian', 0) / total) * 100,
-        'deontological': (framework_counts.get('deontological', 0) / total) * 100
+        'utilitarian': utilitarian_percentage,
+        'deontological': 100 - utilitarian_percentage
     }
     
     return percentages
@@ -102,13 +286,34 @@ def analyze_reaction_times(df):
     }
     
     # Calculate reaction time by framework
-    framework_reaction_times = df.groupby('Ethical Framework')['Reaction Time (s)'].agg(['mean', 'median', 'std'])
+    by_framework = df.groupby('Ethical Framework', observed=True)['Reaction Time (s)']
+    framework_reaction_times = by_framework.agg(['mean', 'median', 'std'])
     
     stats['by_framework'] = framework_reaction_times.to_dict()
     
+    # Box plot statistics per framework (whiskers at the 5th and 95th percentiles)
+    stats['quantiles_by_framework'] = by_framework.quantile(BOXPLOT_QUANTILES).unstack().to_dict('index')
+    
     return stats
 
 
+def _count_by_group(group_codes, framework_codes, ngroups):
+    """
+    Tally framework choices per group with a single np.bincount.
+    
+    Args:
+        group_codes: Integer group code per response
+        framework_codes: Ethical Framework category code per response
+        ngroups: Number of groups
+        
+    Returns:
+        Array of shape (ngroups, 2) with utilitarian and deontological counts
+    """
+    # Each (group, framework) pair gets its own bin: group * 2 + framework
+    bins = group_codes.astype(np.intp) * 2 + framework_codes
+    return np.bincount(bins, minlength=2 * ngroups).reshape(ngroups, 2)
+
+
 def analyze_dilemma_responses(df):
     """
     Analyze responses for each dilemma.
@@ -119,26 +324,33 @@ def analyze_dilemma_responses(df):
     Returns:
         DataFrame with dilemma response statistics
     """
-    # Group by dilemma and calculate statistics
-    dilemma_stats = df.groupby(['Dilemma ID', 'Dilemma Title']).agg({
-        'Ethical Framework': lambda x: x.value_counts().to_dict(),
-        'Reaction Time (s)': ['mean', 'std']
-    }).reset_index()
-    
-    # Calculate framework percentages for each dilemma
-    for idx, row in dilemma_stats.iterrows():
-        framework_counts = row['Ethical Framework']
-        total = sum(framework_counts.values())
-        
-        utilitarian_count = framework_counts.get('utilitarian', 0)
-        deontological_count = framework_counts.get('deontological', 0)
-        
-        dilemma_stats.at[idx, 'Utilitarian %'] = (utilitarian_count / total) * 100
-        dilemma_stats.at[idx, 'Deontological %'] = (deontological_count / total) * 100
-        
-        # Calculate standard deviation of ethical choices (higher means more disagreement)
-        dilemma_stats.at[idx, 'Choice Std Dev'] = np.std([1] * utilitarian_count + [0] * deontological_count)
+    grouped = df.groupby('Dilemma Key')
+    reaction_times = grouped['Reaction Time (s)'].agg(['mean', 'std'])
     
+    # Unpack the dilemma ID and title codes from the grouped keys
+    group_keys = reaction_times.index.to_numpy()
+    dilemma_codes = (group_keys >> np.uint64(32)).astype(np.intp)
+    title_codes = (group_keys & np.uint64(0xFFFFFFFF)).astype(np.intp)
+
+    # Tally per dilemma key, numbering the groups in the same order as the reaction times
+    counts = _count_by_group(grouped.ngroup().to_numpy(np.int32),
+                             df['Ethical Framework'].cat.codes.to_numpy(np.int8),
+                             len(reaction_times))
+    utilitarian_share, deontological_share = (counts / counts.sum(axis=1, keepdims=True)).T
+
+    dilemma_stats = pd.DataFrame({
+        'Dilemma ID': pd.Categorical.from_codes(dilemma_codes, dtype=df['Dilemma ID'].dtype),
+        'Dilemma Title': pd.Categorical.from_codes(title_codes, dtype=df['Dilemma Title'].dtype),
+        'Avg Reaction Time': reaction_times['mean'].to_numpy(),
+        'Reaction Time Std Dev': reaction_times['std'].to_numpy()
+    })
+    # Standard deviation of ethical choices (higher means more disagreement)
+    dilemma_stats[['Utilitarian %', 'Deontological %', 'Choice Std Dev']] = np.column_stack([
+        utilitarian_share * 100,
+        deontological_share * 100,
+        np.sqrt(utilitarian_share * deontological_share)
+    ])
+
     return dilemma_stats
 
 
@@ -152,11 +364,11 @@ def find_correlations(df):
     Returns:
         Dictionary with correlation results
     """
-    # Convert framework to numeric (1 for utilitarian, 0 for deontological)
-    df['Framework Numeric'] = df['Ethical Framework'].apply(lambda x: 1 if x == 'utilitarian' else 0)
+    from scipy import stats
     
-    # Calculate correlation between reaction time and framework
-    correlation, p_value = stats.pointbiserialr(df['Framework Numeric'], df['Reaction Time (s)'])
+    # Point-biserial correlation of framework as 0/1 (1 for utilitarian) with reaction times
+    correlation, p_value = stats.pointbiserialr(df['is_utilitarian'].to_numpy(np.int8),
+                                                df['Reaction Time (s)'].to_numpy(np.float64))
     
     return {
         'correlation': correlation,
@@ -175,15 +387,15 @@ def participant_framework_analysis(df):
     Returns:
         DataFrame with participant framework analysis
     """
-    # Group by participant and calculate framework percentages
-    participant_stats = df.groupby('Participant ID').apply(
-        lambda x: pd.Series({
-            'Total Dilemmas': len(x),
-            'Utilitarian Choices': sum(x['Ethical Framework'] == 'utilitarian'),
-            'Deontological Choices': sum(x['Ethical Framework'] == 'deontological'),
-            'Avg Reaction Time': x['Reaction Time (s)'].mean()
-        })
-    ).reset_index()
+    # Group by participant and count framework choices with native aggregations
+    grouped = df.groupby('Participant ID', observed=True)
+    participant_stats = grouped.agg(**{
+        'Total Dilemmas': ('is_utilitarian', 'size'),
+        'Utilitarian Choices': ('is_utilitarian', 'sum'),
+        'Avg Reaction Time': ('Reaction Time (s)', 'mean')
+    }).reset_index()
+    participant_stats.insert(3, 'Deontological Choices',
+                             participant_stats['Total Dilemmas'] - participant_stats['Utilitarian Choices'])
     
     # Calculate percentages
     participant_stats['Utilitarian %'] = (participant_stats['Utilitarian Choices'] / 
@@ -192,114 +404,150 @@ def participant_framework_analysis(df):
                                            participant_stats['Total Dilemmas']) * 100
     
     # Determine dominant framework
-    def get_dominant_framework(row):
-        if row['Utilitarian %'] > 60:
-            return 'Utilitarian'
-        elif row['Deontological %'] > 60:
-            return 'Deontological'
-        else:
-            return 'Mixed'
-    
-    participant_stats['Dominant Framework'] = participant_stats.apply(get_dominant_framework, axis=1)
+    participant_stats['Dominant Framework'] = pd.Categorical.from_codes(
+        np.select(
+            [participant_stats['Utilitarian %'] > 60, participant_stats['Deontological %'] > 60],
+            [0, 1],
+            default=2
+        ),
+        dtype=DOMINANT_FRAMEWORK_DTYPE
+    )
     
     return participant_stats
 
 
-def generate_visualizations(df, output_dir):
+def generate_visualizations(df, output_dir, dilemma_stats=None, participant_stats=None,
+                            reaction_time_stats=None):
     """
     Generate visualizations from experiment results.
     
     Args:
         df: DataFrame containing experiment results
         output_dir: Directory to save visualizations
+        dilemma_stats: Precomputed output of analyze_dilemma_responses (optional)
+        participant_stats: Precomputed output of participant_framework_analysis (optional)
+        reaction_time_stats: Precomputed output of analyze_reaction_times (optional)
     """
+    from matplotlib.figure import Figure
+    
     os.makedirs(output_dir, exist_ok=True)
     
+    # Render off-screen with the Agg canvas on one figure that is reused for every plot
+    fig = Figure(figsize=(10, 6))
+    ax = fig.add_subplot()
+    
     # 1. Overall framework distribution
-    framework_counts = df['Ethical Framework'].value_counts()
-    plt.figure(figsize=(10, 6))
-    framework_counts.plot(kind='bar', color=['#6200ea', '#ff5722'])
-    plt.title('Distribution of Ethical Frameworks')
-    plt.ylabel('Number of Choices')
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'framework_distribution.png'))
+    framework_counts = df['Ethical Framework'].value_counts(sort=False)
+    framework_counts.plot(kind='bar', color=['#6200ea', '#ff5722'], ax=ax)
+    ax.set_title('Distribution of Ethical Frameworks')
+    ax.set_ylabel('Number of Choices')
+    fig.tight_layout()
+    fig.savefig(os.path.join(output_dir, 'framework_distribution.png'), dpi=80)
     
     # 2. Reaction time distribution
-    plt.figure(figsize=(10, 6))
-    df['Reaction Time (s)'].hist(bins=20, color='#03dac6')
-    plt.title('Distribution of Reaction Times')
-    plt.xlabel('Reaction Time (seconds)')
-    plt.ylabel('Frequency')
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'reaction_time_distribution.png'))
+    ax.clear()
+    ax.hist(df['Reaction Time (s)'].dropna(), bins=20, color='#03dac6')
+    ax.grid(True)
+    ax.set_title('Distribution of Reaction Times')
+    ax.set_xlabel('Reaction Time (seconds)')
+    ax.set_ylabel('Frequency')
+    fig.tight_layout()
+    fig.savefig(os.path.join(output_dir, 'reaction_time_distribution.png'), dpi=80)
     
     # 3. Reaction time by framework
-    plt.figure(figsize=(10, 6))
-    df.boxplot(column='Reaction Time (s)', by='Ethical Framework', color='black')
-    plt.title('Reaction Time by Ethical Framework')
-    plt.suptitle('')  # Remove default suptitle
-    plt.ylabel('Reaction Time (seconds)')
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'reaction_time_by_framework.png'))
+    if reaction_time_stats is None:
+        reaction_time_stats = analyze_reaction_times(df)
+    
+    box_stats = [
+        {'label': framework, 'whislo': q[0.05], 'q1': q[0.25], 'med': q[0.5], 'q3': q[0.75], 'whishi': q[0.95]}
+        for framework, q in reaction_time_stats['quantiles_by_framework'].items()
+    ]
+    
+    ax.clear()
+    ax.bxp(box_stats, showfliers=False,
+           boxprops={'color': 'black'}, medianprops={'color': 'black'},
+           whiskerprops={'color': 'black'}, capprops={'color': 'black'})
+    ax.grid(True)
+    ax.set_title('Reaction Time by Ethical Framework')
+    ax.set_xlabel('Ethical Framework')
+    ax.set_ylabel('Reaction Time (seconds)')
+    fig.tight_layout()
+    fig.savefig(os.path.join(output_dir, 'reaction_time_by_framework.png'), dpi=80)
     
     # 4. Dilemma response distribution
-    dilemma_stats = analyze_dilemma_responses(df)
-    plt.figure(figsize=(12, 8))
+    if dilemma_stats is None:
+        dilemma_stats = analyze_dilemma_responses(df)
     
-    dilemmas = dilemma_stats['Dilemma Title'].tolist()
-    utilitarian_pct = dilemma_stats['Utilitarian %'].tolist()
-    deontological_pct = dilemma_stats['Deontological %'].tolist()
+    # Truncate long titles for the axis labels
+    titles = dilemma_stats['Dilemma Title'].astype('string')
+    labels = titles.where(titles.str.len() <= 20, titles.str.slice(0, 20) + '...')
+    utilitarian_pct = dilemma_stats['Utilitarian %'].to_numpy()
+    deontological_pct = dilemma_stats['Deontological %'].to_numpy()
     
-    x = np.arange(len(dilemmas))
+    x = np.arange(len(dilemma_stats))
     width = 0.35
     
-    fig, ax = plt.subplots(figsize=(14, 8))
+    ax.clear()
+    fig.set_size_inches(14, 8)
     ax.bar(x - width/2, utilitarian_pct, width, label='Utilitarian', color='#6200ea')
     ax.bar(x + width/2, deontological_pct, width, label='Deontological', color='#ff5722')
     
     ax.set_ylabel('Percentage of Choices')
     ax.set_title('Ethical Framework Distribution by Dilemma')
     ax.set_xticks(x)
-    ax.set_xticklabels([d[:20] + '...' if len(d) > 20 else d for d in dilemmas], rotation=45, ha='right')
+    ax.set_xticklabels(labels.tolist(), rotation=45, ha='right')
     ax.legend()
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'dilemma_framework_distribution.png'))
+    fig.tight_layout()
+    fig.savefig(os.path.join(output_dir, 'dilemma_framework_distribution.png'), dpi=80)
     
     # 5. Participant framework distribution
-    participant_stats = participant_framework_analysis(df)
+    if participant_stats is None:
+        participant_stats = participant_framework_analysis(df)
     framework_distribution = participant_stats['Dominant Framework'].value_counts()
-    
-    plt.figure(figsize=(10, 6))
-    framework_distribution.plot(kind='pie', autopct='%1.1f%%', colors=['#6200ea', '#03dac6', '#ff5722'])
-    plt.title('Distribution of Dominant Ethical Frameworks Among Participants')
-    plt.ylabel('')
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'participant_framework_distribution.png'))
+    # Leave frameworks no participant leans towards out of the pie chart
+    framework_distribution = framework_distribution[framework_distribution > 0]
+    
+    ax.clear()
+    fig.set_size_inches(10, 6)
+    framework_distribution.plot(kind='pie', autopct='%1.1f%%', colors=['#6200ea', '#03dac6', '#ff5722'], ax=ax)
+    ax.set_title('Distribution of Dominant Ethical Frameworks Among Participants')
+    ax.set_ylabel('')
+    fig.tight_layout()
+    fig.savefig(os.path.join(output_dir, 'participant_framework_distribution.png'), dpi=80)
 
 
-def generate_report(df, output_file):
+def generate_report(df, output_file, dilemma_stats=None, participant_stats=None,
+                    reaction_time_stats=None):
     """
     Generate a comprehensive analysis report.
     
     Args:
         df: DataFrame containing experiment results
         output_file: Path to save the report
+        dilemma_stats: Precomputed output of analyze_dilemma_responses (optional)
+        participant_stats: Precomputed output of participant_framework_analysis (optional)
+        reaction_time_stats: Precomputed output of analyze_reaction_times (optional)
     """
     # Calculate overall statistics
     total_participants = df['Participant ID'].nunique()
     total_responses = len(df)
     framework_percentages = calculate_framework_percentages(df)
-    reaction_time_stats = analyze_reaction_times(df)
-    dilemma_stats = analyze_dilemma_responses(df)
+    if reaction_time_stats is None:
+        reaction_time_stats = analyze_reaction_times(df)
+    if dilemma_stats is None:
+        dilemma_stats = analyze_dilemma_responses(df)
     correlation_results = find_correlations(df)
-    participant_stats = participant_framework_analysis(df)
+    if participant_stats is None:
+        participant_stats = participant_framework_analysis(df)
+    dominant_counts = participant_stats['Dominant Framework'].value_counts().reindex(
+        DOMINANT_FRAMEWORK_DTYPE.categories, fill_value=0)
     
     # Identify dilemmas with highest disagreement (standard deviation)
     high_disagreement_dilemmas = dilemma_stats.sort_values('Choice Std Dev', ascending=False).head(3)
     
     # Identify dilemmas with longest reaction times
-    long_rt_dilemmas = dilemma_stats.sort_values(('Reaction Time (s)', 'mean'), ascending=False).head(3)
+    long_rt_dilemmas = dilemma_stats.sort_values('Avg Reaction Time', ascending=False).head(3)
     
     # Create report dictionary
     report = {
@@ -323,12 +571,12 @@ def generate_report(df, output_file):
             "significant": bool(correlation_results['significant'])
         },
         "participant_framework_distribution": {
-            "utilitarian_dominant": int(sum(participant_stats['Dominant Framework'] == 'Utilitarian')),
-            "deontological_dominant": int(sum(participant_stats['Dominant Framework'] == 'Deontological')),
-            "mixed": int(sum(participant_stats['Dominant Framework'] == 'Mixed'))
+            "utilitarian_dominant": int(dominant_counts['Utilitarian']),
+            "deontological_dominant": int(dominant_counts['Deontological']),
+            "mixed": int(dominant_counts['Mixed'])
         },
         "high_disagreement_dilemmas": high_disagreement_dilemmas[['Dilemma ID', 'Dilemma Title', 'Choice Std Dev']].to_dict('records'),
-        "long_reaction_time_dilemmas": long_rt_dilemmas[['Dilemma ID', 'Dilemma Title', ('Reaction Time (s)', 'mean')]].to_dict('records')
+        "long_reaction_time_dilemmas": long_rt_dilemmas[['Dilemma ID', 'Dilemma Title', 'Avg Reaction Time']].to_dict('records')
     }
     
     # Save report as JSON
@@ -359,14 +607,23 @@ def run_analysis(results_dir, output_dir):
         print("No results found to analyze.")
         return None
     
+    # Aggregate once and share the results between visualizations and report
+    dilemma_stats = analyze_dilemma_responses(df)
+    participant_stats = participant_framework_analysis(df)
+    reaction_time_stats = analyze_reaction_times(df)
+    
     # Generate visualizations
-    generate_visualizations(df, os.path.join(output_dir, 'visualizations'))
+    generate_visualizations(df, os.path.join(output_dir, 'visualizations'),
+                            dilemma_stats=dilemma_stats, participant_stats=participant_stats,
+                            reaction_time_stats=reaction_time_stats)
     
     # Generate report
-    report = generate_report(df, os.path.join(output_dir, 'analysis_report.json'))
+    report = generate_report(df, os.path.join(output_dir, 'analysis_report.json'),
+                             dilemma_stats=dilemma_stats, participant_stats=participant_stats,
+                             reaction_time_stats=reaction_time_stats)
     
     # Save processed data
-    df.to_csv(os.path.join(output_dir, 'combined_results.csv'), index=False)
+    df.to_csv(os.path.join(output_dir, 'combined_results.csv'), columns=list(RESULT_DTYPES), index=False)
     
     # Print summary
     print(f"Analysis complete. Results saved to {output_dir}")
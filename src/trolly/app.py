@@ -5,38 +5,82 @@ This module provides a simple Flask backend for serving the experiment
 and collecting participant responses.
 """
 
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, abort, jsonify, request
 import os
+import hashlib
+import functools
+import io
 import csv
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from . import dilemmas
 
+try:
+    import orjson
+except ImportError:  # optional, installed with the 'all' extra
+    orjson = None
+
 app = Flask(__name__, static_folder='../../')
 
 # Ensure results directory exists
 RESULTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'results')
 os.makedirs(RESULTS_DIR, exist_ok=True)
 
+# Result files are written in the background so responses don't wait on disk I/O
+EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+def _dumps(obj):
+    """Serialize an object to JSON bytes, using orjson when available."""
+    # Read-only mappings (such as the dilemmas) are serialized as plain dicts
+    if orjson is not None:
+        return orjson.dumps(obj, default=dict)
+    return json.dumps(obj, default=dict).encode('utf-8')
+
+# The dilemmas are static, so serialize them once at import
+_DILEMMAS_JSON = _dumps(dilemmas.get_all_dilemmas())
+_DILEMMAS_ETAG = hashlib.blake2b(_DILEMMAS_JSON, digest_size=8).hexdigest()
+
+@functools.lru_cache(maxsize=None)
+def _read_static(filename):
+    """Read a static file once and cache its contents and ETag."""
+    with open(os.path.join(app.static_folder, filename), 'rb') as f:
+        body = f.read()
+    return body, hashlib.blake2b(body, digest_size=8).hexdigest()
+
+def _static_response(filename, mimetype):
+    """Serve a cached static file, answering conditional requests."""
+    try:
+        body, etag = _read_static(filename)
+    except FileNotFoundError:
+        abort(404)
+    response = Response(body, mimetype=mimetype)
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
 @app.route('/')
 def index():
     """Serve the main experiment page."""
-    return send_from_directory(app.static_folder, 'index.html')
+    return _static_response('index.html', 'text/html')
 
 @app.route('/styles.css')
 def styles():
     """Serve the CSS file."""
-    return send_from_directory(app.static_folder, 'styles.css')
+    return _static_response('styles.css', 'text/css')
 
 @app.route('/script.js')
 def script():
     """Serve the JavaScript file."""
-    return send_from_directory(app.static_folder, 'script.js')
+    return _static_response('script.js', 'text/javascript')
 
 @app.route('/api/dilemmas')
 def get_dilemmas():
     """Return all dilemmas as JSON."""
-    return jsonify(dilemmas.get_all_dilemmas())
+    response = Response(_DILEMMAS_JSON, mimetype='application/json')
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    response.set_etag(_DILEMMAS_ETAG, weak=True)
+    return response.make_conditional(request)
 
 @app.route('/api/results', methods=['POST'])
 def save_results():
@@ -54,66 +98,76 @@ def save_results():
     filename = f"trolley_results_{participant_id}_{timestamp.split('T')[0]}.csv"
     filepath = os.path.join(RESULTS_DIR, filename)
     
+    # Build the CSV rows, count utilitarian choices and total reaction time in a single pass,
+    # rejecting malformed records before anything is written
+    rows = []
+    utilitarian_choices = 0
+    total_reaction_time = 0.0
+    try:
+        for r in results:
+            rows.append((participant_id, r['dilemmaId'], r['dilemmaTitle'], r['choice'],
+                         r['framework'], r['reactionTime'], r['timestamp']))
+            if r['framework'] == 'utilitarian':
+                utilitarian_choices += 1
+            total_reaction_time += r['reactionTime']
+    except (KeyError, TypeError):
+        return jsonify({'error': 'Invalid data format'}), 400
+    
     # Calculate framework percentages
-    utilitarian_choices = sum(1 for r in results if r['framework'] == 'utilitarian')
     total_choices = len(results)
     utilitarian_percentage = (utilitarian_choices / total_choices) * 100 if total_choices > 0 else 0
     deontological_percentage = 100 - utilitarian_percentage
     
     # Calculate average reaction time
-    total_reaction_time = sum(r['reactionTime'] for r in results)
     average_reaction_time = total_reaction_time / total_choices if total_choices > 0 else 0
     
-    # Write results to CSV
-    with open(filepath, 'w', newline='') as csvfile:
-        fieldnames = ['Participant ID', 'Dilemma ID', 'Dilemma Title', 'Choice', 
-                     'Ethical Framework', 'Reaction Time (s)', 'Timestamp']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        
-        writer.writeheader()
-        for result in results:
-            writer.writerow({
-                'Participant ID': participant_id,
-                'Dilemma ID': result['dilemmaId'],
-                'Dilemma Title': result['dilemmaTitle'],
-                'Choice': result['choice'],
-                'Ethical Framework': result['framework'],
-                'Reaction Time (s)': result['reactionTime'],
-                'Timestamp': result['timestamp']
-            })
-        
-        # Add summary rows
-        writer.writerow({})
-        writer.writerow({'Participant ID': 'Summary'})
-        writer.writerow({
-            'Participant ID': 'Utilitarian Percentage',
-            'Dilemma ID': f"{utilitarian_percentage:.2f}%"
-        })
-        writer.writerow({
-            'Participant ID': 'Deontological Percentage',
-            'Dilemma ID': f"{deontological_percentage:.2f}%"
-        })
-        writer.writerow({
-            'Participant ID': 'Average Reaction Time',
-            'Dilemma ID': f"{average_reaction_time:.2f}s"
-        })
+    summary = {
+        'utilitarian_percentage': utilitarian_percentage,
+        'deontological_percentage': deontological_percentage,
+        'average_reaction_time': average_reaction_time
+    }
     
     # Also save as JSON for easier processing
     json_filepath = os.path.join(RESULTS_DIR, f"trolley_results_{participant_id}_{timestamp.split('T')[0]}.json")
-    with open(json_filepath, 'w') as jsonfile:
-        json.dump({
-            'participant_id': participant_id,
-            'timestamp': timestamp,
-            'results': results,
-            'summary': {
-                'utilitarian_percentage': utilitarian_percentage,
-                'deontological_percentage': deontological_percentage,
-                'average_reaction_time': average_reaction_time
-            }
-        }, jsonfile, indent=2)
+    payload = {
+        'participant_id': participant_id,
+        'timestamp': timestamp,
+        'results': results,
+        'summary': summary
+    }
+    
+    EXECUTOR.submit(_write_csv, filepath, rows).add_done_callback(_report_write_error)
+    EXECUTOR.submit(_write_json, json_filepath, payload).add_done_callback(_report_write_error)
     
     return jsonify({'success': True, 'filepath': filepath})
 
+def _write_csv(filepath, rows):
+    """Write a participant's result rows to a CSV file (the summary lives in the JSON file)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    
+    writer.writerow(['Participant ID', 'Dilemma ID', 'Dilemma Title', 'Choice', 
+                     'Ethical Framework', 'Reaction Time (s)', 'Timestamp'])
+    writer.writerows(rows)
+    
+    with open(filepath, 'w', newline='') as csvfile:
+        csvfile.write(buffer.getvalue())
+
+def _write_json(filepath, payload):
+    """Write a participant's results and summary to a JSON file."""
+    if orjson is not None:
+        with open(filepath, 'wb') as jsonfile:
+            jsonfile.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, 'w') as jsonfile:
+            json.dump(payload, jsonfile, indent=2)
+
+def _report_write_error(future):
+    """Print errors raised by background result writes."""
+    error = future.exception()
+    if error is not None:
+        print(f"Error saving results: {error}")
+
 def create_app():
     """Create and configure the Flask application."""
     return app
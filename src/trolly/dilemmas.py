@@ -5,7 +5,9 @@ This module defines the ethical dilemmas used in the experiment,
 with each dilemma presenting a choice between utilitarian and deontological ethics.
 """
 
-DILEMMAS = [
+from types import MappingProxyType
+
+_RAW_DILEMMAS = [
     {
         "id": 1,
         "title": "Autonomous Vehicle Decision",
@@ -158,13 +160,23 @@ DILEMMAS = [
     }
 ]
 
+# Read-only views, so the shared dilemma data can be handed out without copying
+DILEMMAS = tuple(
+    MappingProxyType({
+        **d,
+        "leftChoice": MappingProxyType(d["leftChoice"]),
+        "rightChoice": MappingProxyType(d["rightChoice"])
+    })
+    for d in _RAW_DILEMMAS
+)
+
+# Index dilemmas by ID for constant-time lookups
+_DILEMMAS_BY_ID = {d["id"]: d for d in DILEMMAS}
+
 def get_all_dilemmas():
     """Return all dilemmas."""
     return DILEMMAS
 
 def get_dilemma_by_id(dilemma_id):
     """Return a specific dilemma by ID."""
-    for dilemma in DILEMMAS:
-        if dilemma["id"] == dilemma_id:
-            return dilemma
-    return None
+    return _DILEMMAS_BY_ID.get(dilemma_id)
@@ -0,0 +1,18 @@
+"""
+Naming of the experiment result files.
+
+Shared by the analytics and the results viewer, and kept free of heavy
+imports so the viewer can list results without loading pandas.
+"""
+
+import re
+
+# Result file formats: CSV as written by the experiment app, or Parquet
+RESULT_FILE_EXTENSIONS = ('.csv', '.parquet')
+
+# Result file names, capturing the participant ID and date
+RESULT_FILE_RE = re.compile(
+    r'trolley_results_([^_]*)(?:_(.*))?(?:{})'.format(
+        '|'.join(re.escape(extension) for extension in RESULT_FILE_EXTENSIONS)
+    )
+)
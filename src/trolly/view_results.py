@@ -6,61 +6,172 @@ the results of the ethical trolley problem experiment.
 """
 
 import os
+import csv
 import json
-import pandas as pd
-from tabulate import tabulate
-import matplotlib.pyplot as plt
-from .analytics import load_results_from_csv, analyze_dilemma_responses, participant_framework_analysis
+import functools
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from .result_files import RESULT_FILE_RE
+
+# pandas, matplotlib and tabulate are imported inside the functions that use them,
+# so the menu starts without paying for their initialization
+
+# Columns needed for the all-participants summary
+NEEDED_COLS = ("Participant ID", "Ethical Framework", "Reaction Time (s)")
+
+# Table headers for the listings
+RESULTS_HEADERS = ("Participant ID", "Date", "Filename")
+RESPONSE_HEADERS = ("ID", "Dilemma", "Framework", "Reaction Time")
+PARTICIPANT_HEADERS = ("ID", "Dilemmas", "Utilitarian", "Deontological", "Avg RT", "Framework")
+
+# Combined results of the last all-participants load and the file signature it was built from
+_CACHE = {'signature': None, 'combined': None}
+
+# Off-screen figure and axes reused for every saved plot, created on first use
+_FIG, _AX = None, None
+
+@functools.lru_cache(maxsize=128)
+def _load_cached(file_path, mtime, columns=None):
+    """Load a result file, reusing the parsed DataFrame until the file's mtime changes."""
+    from .analytics import load_results
+    return load_results(file_path, columns)
+
+def _load(file_path, columns=None):
+    """Load a result file through the parse cache."""
+    from .analytics import load_results
+    try:
+        mtime = os.path.getmtime(file_path)
+    except OSError:
+        # Let the loader report the missing file
+        return load_results(file_path, columns)
+    return _load_cached(file_path, mtime, columns)
+
+@functools.lru_cache(maxsize=4)
+def _get_viz_dir(results_dir):
+    """Return the visualizations directory for a results directory, creating it once."""
+    output_dir = os.path.join(results_dir, 'visualizations')
+    os.makedirs(output_dir, exist_ok=True)
+    return output_dir
+
+def _get_ax():
+    """Return the shared off-screen axes, cleared for a new plot."""
+    global _FIG, _AX
+    if _AX is None:
+        from matplotlib.figure import Figure
+        # A bare Figure renders with Agg, so no GUI backend is loaded just to save plots
+        _FIG = Figure(figsize=(10, 6))
+        _AX = _FIG.add_subplot()
+    else:
+        _AX.cla()
+    return _AX
+
+def _plot_framework_bars(ax, frameworks, counts, colors, title, ylabel):
+    """Draw a framework distribution bar chart on the given axes."""
+    ax.bar(frameworks, counts, color=colors)
+    ax.set_title(title)
+    ax.set_ylabel(ylabel)
+    ax.figure.tight_layout()
+
+def _read_responses(file_path):
+    """Read the responses in a result file as a list of row dicts."""
+    if not file_path.endswith('.csv'):
+        # Columnar formats still go through the DataFrame loader
+        df = _load(file_path)
+        return None if df is None else df.to_dict('records')
+    try:
+        with open(file_path, newline='', encoding='utf-8') as f:
+            # Skip summary rows written by older versions of the app and unknown frameworks
+            return [row for row in csv.DictReader(f)
+                    if row.get('Dilemma ID') and row.get('Ethical Framework') in ('utilitarian', 'deontological')]
+    except (OSError, csv.Error) as e:
+        print(f"Error loading results: {e}")
+        return None
+
+def _save_and_offer_plot(output_path, *plot_args):
+    """Render a bar chart to a PNG off-screen and show it on request."""
+    ax = _get_ax()
+    _plot_framework_bars(ax, *plot_args)
+    ax.figure.savefig(output_path)
+    print(f"\nVisualization saved to: {output_path}")
+    
+    # Ask if user wants to open the visualization
+    try:
+        response = input("\nWould you like to view the visualization? (y/n): ")
+        if response.lower() == 'y':
+            import matplotlib.pyplot as plt
+            fig = plt.figure(figsize=(10, 6))
+            _plot_framework_bars(fig.add_subplot(), *plot_args)
+            plt.show()
+            plt.close(fig)
+    except Exception:
+        pass
 
 def list_results(results_dir):
     """List all result files in the directory."""
+    from tabulate import tabulate
     results = []
-    for filename in os.listdir(results_dir):
-        if filename.endswith('.csv') and 'trolley_results' in filename:
-            # Extract participant ID from filename
-            parts = filename.replace('trolley_results_', '').split('_')
-            participant_id = parts[0]
-            date = '_'.join(parts[1:]).replace('.csv', '')
-            results.append((participant_id, date, filename))
+    with os.scandir(results_dir) as entries:
+        for entry in entries:
+            # Extract participant ID and date from filename
+            match = RESULT_FILE_RE.fullmatch(entry.name)
+            if not match or not entry.is_file(follow_symlinks=False):
+                continue
+            participant_id, date = match.group(1), match.group(2) or ''
+            results.append((participant_id, date, entry.name))
     
     if not results:
         print("No results found in directory:", results_dir)
         return
     
     print("\nAvailable Results:")
-    print(tabulate(results, headers=["Participant ID", "Date", "Filename"]))
+    print(tabulate(results, headers=RESULTS_HEADERS, tablefmt='plain'))
 
 def view_participant_summary(results_dir, participant_id=None, filename=None):
     """View summary for a specific participant."""
+    from tabulate import tabulate
     if filename:
         file_path = os.path.join(results_dir, filename)
     elif participant_id:
         # Find the most recent file for this participant
-        matching_files = [f for f in os.listdir(results_dir) 
-                         if f.endswith('.csv') and f'trolley_results_{participant_id}' in f]
+        prefix = f'trolley_results_{participant_id}'
+        with os.scandir(results_dir) as entries:
+            matching_files = [entry.name for entry in entries
+                              if entry.name.startswith(prefix) and RESULT_FILE_RE.fullmatch(entry.name)
+                              and entry.is_file(follow_symlinks=False)]
         if not matching_files:
             print(f"No results found for participant: {participant_id}")
             return
-        file_path = os.path.join(results_dir, sorted(matching_files)[-1])  # Get the most recent
+        file_path = os.path.join(results_dir, max(matching_files))  # Get the most recent
     else:
         print("Please provide either participant_id or filename")
         return
     
     # Load the data
-    df = load_results_from_csv(file_path)
-    if df is None or df.empty:
+    rows = _read_responses(file_path)
+    if not rows:
         print(f"Could not load data from: {file_path}")
         return
     
-    # Calculate basic statistics
-    total_dilemmas = len(df)
-    utilitarian_choices = sum(df['Ethical Framework'] == 'utilitarian')
-    deontological_choices = sum(df['Ethical Framework'] == 'deontological')
-    avg_reaction_time = df['Reaction Time (s)'].mean()
+    # Calculate basic statistics in a single pass over the rows
+    total_dilemmas = len(rows)
+    framework_counts = Counter()
+    total_reaction_time = 0.0
+    response_data = []
+    for row in rows:
+        framework = row['Ethical Framework']
+        reaction_time = float(row['Reaction Time (s)'])
+        framework_counts[framework] += 1
+        total_reaction_time += reaction_time
+        response_data.append([row['Dilemma ID'], row['Dilemma Title'],
+                              framework.capitalize(), f"{reaction_time:.2f}s"])
+    utilitarian_choices = framework_counts['utilitarian']
+    deontological_choices = framework_counts['deontological']
+    avg_reaction_time = total_reaction_time / total_dilemmas
+    participant = rows[0]['Participant ID']
     
     # Print summary
     print("\nParticipant Summary:")
-    print(f"Participant ID: {df['Participant ID'].iloc[0]}")
+    print(f"Participant ID: {participant}")
     print(f"Total dilemmas answered: {total_dilemmas}")
     print(f"Utilitarian choices: {utilitarian_choices} ({utilitarian_choices/total_dilemmas*100:.1f}%)")
     print(f"Deontological choices: {deontological_choices} ({deontological_choices/total_dilemmas*100:.1f}%)")
@@ -78,57 +189,69 @@ def view_participant_summary(results_dir, participant_id=None, filename=None):
     
     # Show detailed responses
     print("\nDetailed Responses:")
-    response_data = []
-    for _, row in df.iterrows():
-        response_data.append([
-            row['Dilemma ID'],
-            row['Dilemma Title'],
-            row['Ethical Framework'].capitalize(),
-            f"{row['Reaction Time (s)']:.2f}s"
-        ])
-    
-    print(tabulate(response_data, headers=["ID", "Dilemma", "Framework", "Reaction Time"]))
-    
-    # Plot the results
-    plt.figure(figsize=(10, 6))
-    frameworks = ['Utilitarian', 'Deontological']
-    counts = [utilitarian_choices, deontological_choices]
-    plt.bar(frameworks, counts, color=['#6200ea', '#ff5722'])
-    plt.title(f'Ethical Framework Distribution - Participant {df["Participant ID"].iloc[0]}')
-    plt.ylabel('Number of Choices')
-    plt.tight_layout()
-    
-    # Save the plot
-    output_dir = os.path.join(results_dir, 'visualizations')
-    os.makedirs(output_dir, exist_ok=True)
-    plt.savefig(os.path.join(output_dir, f'participant_{df["Participant ID"].iloc[0]}_distribution.png'))
-    print(f"\nVisualization saved to: {output_dir}/participant_{df['Participant ID'].iloc[0]}_distribution.png")
     
-    # Ask if user wants to open the visualization
+    print(tabulate(response_data, headers=RESPONSE_HEADERS, tablefmt='plain'))
+    
+    # Plot and save the results
+    output_dir = _get_viz_dir(results_dir)
+    _save_and_offer_plot(
+        f"{output_dir}/participant_{participant}_distribution.png",
+        ['Utilitarian', 'Deontological'],
+        [utilitarian_choices, deontological_choices],
+        ['#6200ea', '#ff5722'],
+        f'Ethical Framework Distribution - Participant {participant}',
+        'Number of Choices'
+    )
+
+def _load_combined(results_dir):
+    """Load all result files into one DataFrame, reusing it while the files are unchanged."""
+    import pandas as pd
+    from .analytics import load_results_dataset
+    
+    # Find all result files
+    with os.scandir(results_dir) as entries:
+        result_entries = [entry for entry in entries
+                          if RESULT_FILE_RE.fullmatch(entry.name) and entry.is_file(follow_symlinks=False)]
+    
+    # Files added, removed or rewritten since the last load change the signature
+    signature = frozenset((entry.path, entry.stat().st_mtime_ns) for entry in result_entries)
+    if _CACHE['signature'] == signature:
+        return _CACHE['combined']
+    
+    # Read and concatenate all files in one pass when pyarrow is available
+    combined_df = None
     try:
-        response = input("\nWould you like to view the visualization? (y/n): ")
-        if response.lower() == 'y':
-            plt.show()
-    except Exception:
+        combined_df = load_results_dataset([entry.path for entry in result_entries], NEEDED_COLS)
+    except ImportError:
         pass
+    
+    if combined_df is None:
+        # Fall back to loading file by file, overlapping reads in a thread pool
+        all_dfs = []
+        if result_entries:
+            with ThreadPoolExecutor(max_workers=min(8, len(result_entries))) as executor:
+                loaded = executor.map(
+                    lambda entry: _load_cached(entry.path, entry.stat().st_mtime, NEEDED_COLS),
+                    result_entries
+                )
+                all_dfs = [df for df in loaded if df is not None and not df.empty]
+        combined_df = pd.concat(all_dfs, ignore_index=True) if all_dfs else pd.DataFrame()
+    
+    _CACHE['signature'] = signature
+    _CACHE['combined'] = combined_df
+    return combined_df
 
 def view_all_participants_summary(results_dir):
     """View summary of all participants."""
-    # Load all results
-    all_dfs = []
-    for filename in os.listdir(results_dir):
-        if filename.endswith('.csv') and 'trolley_results' in filename:
-            file_path = os.path.join(results_dir, filename)
-            df = load_results_from_csv(file_path)
-            if df is not None and not df.empty:
-                all_dfs.append(df)
-    
-    if not all_dfs:
+    import pandas as pd
+    from tabulate import tabulate
+    from .analytics import participant_framework_analysis
+    
+    combined_df = _load_combined(results_dir)
+    if combined_df.empty:
         print("No results found to analyze.")
         return
     
-    combined_df = pd.concat(all_dfs, ignore_index=True)
-    
     # Get participant statistics
     participant_stats = participant_framework_analysis(combined_df)
     
@@ -138,13 +261,11 @@ def view_all_participants_summary(results_dir):
     print(f"Total responses: {len(combined_df)}")
     
     # Framework distribution
-    utilitarian_dominant = sum(participant_stats['Dominant Framework'] == 'Utilitarian')
-    deontological_dominant = sum(participant_stats['Dominant Framework'] == 'Deontological')
-    mixed_dominant = sum(participant_stats['Dominant Framework'] == 'Mixed')
-    
-    print(f"Participants with Utilitarian tendency: {utilitarian_dominant} ({utilitarian_dominant/len(participant_stats)*100:.1f}%)")
-    print(f"Participants with Deontological tendency: {deontological_dominant} ({deontological_dominant/len(participant_stats)*100:.1f}%)")
-    print(f"Participants with Mixed tendency: {mixed_dominant} ({mixed_dominant/len(participant_stats)*100:.1f}%)")
+    # Counts come back in category order: Utilitarian, Deontological, Mixed
+    dominant_counts = participant_stats['Dominant Framework'].value_counts(sort=False)
+    dominant_percentages = dominant_counts / len(participant_stats) * 100
+    for framework, count in dominant_counts.items():
+        print(f"Participants with {framework} tendency: {count} ({dominant_percentages[framework]:.1f}%)")
     
     # Average reaction time
     avg_rt = combined_df['Reaction Time (s)'].mean()
@@ -152,41 +273,27 @@ def view_all_participants_summary(results_dir):
     
     # Participant details
     print("\nParticipant Details:")
-    participant_data = []
-    for _, row in participant_stats.iterrows():
-        participant_data.append([
-            row['Participant ID'],
-            row['Total Dilemmas'],
-            f"{row['Utilitarian %']:.1f}%",
-            f"{row['Deontological %']:.1f}%",
-            f"{row['Avg Reaction Time']:.2f}s",
-            row['Dominant Framework']
-        ])
-    
-    print(tabulate(participant_data, headers=["ID", "Dilemmas", "Utilitarian", "Deontological", "Avg RT", "Framework"]))
-    
-    # Plot the results
-    plt.figure(figsize=(10, 6))
-    frameworks = ['Utilitarian', 'Deontological', 'Mixed']
-    counts = [utilitarian_dominant, deontological_dominant, mixed_dominant]
-    plt.bar(frameworks, counts, color=['#6200ea', '#ff5722', '#03dac6'])
-    plt.title('Dominant Ethical Framework Distribution Among Participants')
-    plt.ylabel('Number of Participants')
-    plt.tight_layout()
-    
-    # Save the plot
-    output_dir = os.path.join(results_dir, 'visualizations')
-    os.makedirs(output_dir, exist_ok=True)
-    plt.savefig(os.path.join(output_dir, 'all_participants_framework_distribution.png'))
-    print(f"\nVisualization saved to: {output_dir}/all_participants_framework_distribution.png")
+    participant_data = pd.DataFrame({
+        'ID': participant_stats['Participant ID'].astype(str),
+        'Dilemmas': participant_stats['Total Dilemmas'],
+        'Utilitarian': participant_stats['Utilitarian %'].map('{:.1f}%'.format),
+        'Deontological': participant_stats['Deontological %'].map('{:.1f}%'.format),
+        'Avg RT': participant_stats['Avg Reaction Time'].map('{:.2f}s'.format),
+        'Framework': participant_stats['Dominant Framework'].astype(str)
+    }).values.tolist()
     
-    # Ask if user wants to open the visualization
-    try:
-        response = input("\nWould you like to view the visualization? (y/n): ")
-        if response.lower() == 'y':
-            plt.show()
-    except Exception:
-        pass
+    print(tabulate(participant_data, headers=PARTICIPANT_HEADERS, tablefmt='plain'))
+    
+    # Plot and save the results
+    output_dir = _get_viz_dir(results_dir)
+    _save_and_offer_plot(
+        f"{output_dir}/all_participants_framework_distribution.png",
+        ['Utilitarian', 'Deontological', 'Mixed'],
+        dominant_counts.tolist(),
+        ['#6200ea', '#ff5722', '#03dac6'],
+        'Dominant Ethical Framework Distribution Among Participants',
+        'Number of Participants'
+    )
 
 def main():
     """Main function to run the script."""
@@ -212,7 +319,7 @@ def main():
         elif choice == '2':
             list_results(results_dir)
             participant_input = input("\nEnter participant ID or filename: ")
-            if 'trolley_results' in participant_input and participant_input.endswith('.csv'):
+            if RESULT_FILE_RE.fullmatch(participant_input):
                 view_participant_summary(results_dir, filename=participant_input)
             else:
                 view_participant_summary(results_dir, participant_id=participant_input)